@@ -11,12 +11,107 @@ from __future__ import annotations
 
 import time
 import tkinter as tk
+from array import array
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import messagebox, ttk
-from typing import Callable, Dict, Generator, Iterable, List, Optional, Set, Tuple
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 Step = Tuple[str, int, Optional[int]]
 StepGenerator = Generator[Step, None, None]
 
+# Aktionscodes der abgespielten Schrittfolge; die Reihenfolge bestimmt den
+# Index der zugehörigen Darstellungsroutine.
+STEP_ACTIONS: Tuple[str, ...] = (
+    "compare",
+    "flash_compare",
+    "swap",
+    "overwrite",
+    "revert",
+    "mark_sorted",
+)
+ACTION_CODES: Dict[str, int] = {
+    action: code for code, action in enumerate(STEP_ACTIONS)
+}
+COMPARE, FLASH_COMPARE, SWAP, OVERWRITE, REVERT, MARK_SORTED = range(len(STEP_ACTIONS))
+
+
+def _ceil_log2(n: int) -> int:
+    """Liefert ⌈log₂ n⌉ für n ≥ 1 (0 für n = 1)."""
+
+    return max(n - 1, 0).bit_length()
+
+
+# Obergrenzen für die Anzahl der Rohschritte je Verfahren und Eingabelänge n.
+# Damit können die Arrays einer Schrittfolge vorab in passender Größe
+# angelegt werden, statt während der Erzeugung wachsen zu müssen.
+STEP_UPPER_BOUNDS: Dict[str, Callable[[int], int]] = {
+    "bubble": lambda n: 3 * n * (n - 1) // 2 + 2 * n,
+    "selection": lambda n: n * (n - 1) + 3 * n,
+    "insertion": lambda n: 2 * n * n + n,
+    "merge": lambda n: 4 * n * _ceil_log2(n) + n,
+    "quick": lambda n: 3 * n * (n + 1) // 2 + 10 * n,
+    "heap": lambda n: 9 * n * _ceil_log2(n) + 9 * n,
+}
+
+
+class StepTrace:
+    """Vorab berechnete Schrittfolge als parallele Integer-Arrays.
+
+    Statt eines Tupels pro Schritt werden Aktionscode, erster Index und
+    zweiter Operand in je einem ``array.array`` abgelegt. Der zweite Operand
+    ist der zweite Index bzw. bei ``overwrite`` die Position des geschriebenen
+    Werts in ``values``; so bleiben die Arrays auch bei sehr großen Eingaben
+    im ``int``-Bereich. Die Arrays werden mit ``capacity`` Einträgen
+    vorbelegt und nach dem Befüllen auf die tatsächliche Länge gekürzt.
+    """
+
+    def __init__(self, numbers: Sequence[int], capacity: int) -> None:
+        self.actions = array("B", bytes(capacity))
+        self.first = array("i", [0]) * capacity
+        self.second = array("i", [0]) * capacity
+        self.length = 0
+        self.values: Tuple[int, ...] = tuple(sorted(set(numbers)))
+        self._value_slots = {value: slot for slot, value in enumerate(self.values)}
+
+    def __len__(self) -> int:
+        return self.length
+
+    def append(self, step: Step) -> None:
+        """Kodiert einen Schritt aus einem Schrittgenerator und hängt ihn an."""
+
+        index = self.length
+        if index >= len(self.actions):
+            raise IndexError("Die Schrittfolge überschreitet die berechnete Obergrenze.")
+
+        action, first_index, second_value = step
+        code = ACTION_CODES[action]
+        if code == OVERWRITE:
+            second_value = self._value_slots[second_value]
+        elif second_value is None:
+            second_value = 0
+        self.actions[index] = code
+        self.first[index] = first_index
+        self.second[index] = second_value
+        self.length = index + 1
+
+    def truncate(self, length: int) -> None:
+        """Kürzt die Schrittfolge und gibt ungenutzten Speicher frei."""
+
+        del self.actions[length:]
+        del self.first[length:]
+        del self.second[length:]
+        self.length = length
+
 
 class SortingVisualizer:
     """GUI-Anwendung zur Visualisierung verschiedener Sortieralgorithmen."""
@@ -28,6 +123,8 @@ class SortingVisualizer:
 
     DEFAULT_ANIMATION_DELAY_MS = 800
     TIMER_UPDATE_INTERVAL_MS = 20
+    TRACE_CACHE_SIZE = 32  # Anzahl gemerkter Schrittfolgen für Wiederholungen
+    TRACE_POLL_INTERVAL_MS = 30  # Prüfintervall für die Schrittberechnung
 
     BAR_PADDING = 40  # Abstand links und rechts im Canvas
 
@@ -120,8 +217,8 @@ class SortingVisualizer:
             },
             "merge": {
                 "description": (
-                    "Teilt die Liste rekursiv, sortiert die Hälften und fügt sie geordnet "
-                    "wieder zusammen."
+                    "Fügt zuerst einzelne Werte, dann immer längere sortierte Teilfolgen "
+                    "geordnet zusammen, bis die ganze Liste sortiert ist."
                 ),
                 "advantages": [
                     "Sehr gute Laufzeit O(n log n) auch im schlechtesten Fall",
@@ -194,8 +291,21 @@ class SortingVisualizer:
 
         # Variablen zur Steuerung der Animation
         self.animation_speed_ms = self.DEFAULT_ANIMATION_DELAY_MS
-        self.step_generator: Optional[StepGenerator] = None
+        self.step_trace: Optional[StepTrace] = None
+        self.step_index = 0
+        # Bereits berechnete Schrittfolgen je (Verfahren, Eingabe), damit ein
+        # erneuter Lauf mit denselben Zahlen sofort starten kann.
+        self.trace_cache: OrderedDict[Tuple[str, Tuple[int, ...]], StepTrace] = (
+            OrderedDict()
+        )
+        # Neue Schrittfolgen werden in einem Hintergrund-Thread berechnet; die
+        # Oberfläche fragt per after-Callback nach, ob das Ergebnis vorliegt.
+        self.trace_executor = ThreadPoolExecutor(max_workers=1)
+        self.trace_future: Optional[Future[StepTrace]] = None
+        self.trace_poll_after_id: Optional[str] = None
         self.after_id: Optional[str] = None
+        self.flash_after_id: Optional[str] = None
+        self.flash_indices: Optional[Tuple[int, int]] = None
         self.is_running = False
         self.is_paused = False
         self.elapsed_time_ms = 0.0
@@ -203,11 +313,25 @@ class SortingVisualizer:
         self.timer_after_id: Optional[str] = None
         self.timer_value_var = tk.StringVar(value="0 ms (0,00 s)")
 
+        # Darstellungsroutinen, indiziert über den Aktionscode (siehe
+        # STEP_ACTIONS); ersetzt eine if/elif-Kette bei jedem Schritt.
+        self._step_handlers: List[Callable[[int, int], None]] = [
+            self._highlight_compare,
+            self._flash_compare,
+            self._highlight_swap,
+            self._apply_overwrite_slot,
+            self._reset_colors,
+            lambda index, _unused: self._mark_sorted(index),
+        ]
+
         # Datenstrukturen für die Visualisierung
         self.current_data: List[int] = []
-        self.sorted_indices: Set[int] = set()
+        # sorted_mask[i] ist True, sobald Position i endgültig sortiert ist.
+        self.sorted_mask: List[bool] = []
+        self.sorted_count = 0
         self.bar_rects: List[int] = []
         self.bar_texts: List[int] = []
+        self.bar_colors: List[str] = []  # zuletzt gesetzte Füllfarbe je Balken
         self._is_finalizing_run = False
         self.value_min = 0
         self.value_max = 0
@@ -216,6 +340,15 @@ class SortingVisualizer:
         self.bar_width = 0.0
         self.base_line_y = self.canvas_height - 40
 
+        # Vorberechnete Geometrie: x-Koordinaten pro Position sowie Balkenhöhe,
+        # Beschriftungshöhe und Beschriftungstext pro vorkommendem Wert.
+        self.bar_x_centers: List[float] = []
+        self.bar_x0: List[float] = []
+        self.bar_x1: List[float] = []
+        self.bar_heights: Dict[int, float] = {}
+        self.label_ys: Dict[int, float] = {}
+        self.label_texts: Dict[int, str] = {}
+
         self._build_layout()
 
     # ------------------------------------------------------------------
@@ -413,7 +546,8 @@ class SortingVisualizer:
             return
 
         self.current_data = list(numbers)
-        self.sorted_indices.clear()
+        self.sorted_mask = [False] * len(self.current_data)
+        self.sorted_count = 0
         self._create_bars(self.current_data)
 
         algorithm_key = self.algorithm_var.get()
@@ -426,7 +560,8 @@ class SortingVisualizer:
             return
 
         self.active_algorithm_key = algorithm_key
-        self.step_generator = generator_func(self.current_data)
+        self.step_trace = None
+        self.step_index = 0
         self.is_running = True
         self.is_paused = False
         self.animation_speed_ms = self.DEFAULT_ANIMATION_DELAY_MS
@@ -434,8 +569,25 @@ class SortingVisualizer:
         self.start_button.config(state=tk.DISABLED)
         self._set_algorithm_buttons_state(tk.DISABLED)
 
-        self._start_timer()
-        self.perform_next_step()
+        # Die Stoppuhr läuft erst mit der Animation an, damit die Wartezeit auf
+        # eine neu berechnete Schrittfolge nicht in die Rundenzeit eingeht.
+        self._reset_timer()
+
+        # Die komplette Schrittfolge wird einmalig vorab berechnet, damit die
+        # Animation nur noch fertige Arrays abspielt. Bekannte Eingaben kommen
+        # direkt aus dem Cache, alle anderen aus dem Hintergrund-Thread.
+        cache_key = (algorithm_key, tuple(self.current_data))
+        cached_trace = self._lookup_step_trace(cache_key)
+        if cached_trace is not None:
+            self.step_trace = cached_trace
+            self._start_playback()
+            return
+
+        capacity = STEP_UPPER_BOUNDS[algorithm_key](len(self.current_data))
+        self.trace_future = self.trace_executor.submit(
+            self._build_step_trace, generator_func, list(self.current_data), capacity
+        )
+        self._await_step_trace(cache_key)
 
     def pause_or_resume(self) -> None:
         """Pausiert oder setzt die Animation fort."""
@@ -462,20 +614,36 @@ class SortingVisualizer:
     def reset(self) -> None:
         """Setzt die Anwendung in den Ausgangszustand zurück."""
 
+        self._abort_run()
+
+        self.run_history.clear()
+        self.total_runs = 0
+        self._update_results_table()
+
+        for entry in self.input_entries:
+            entry.delete(0, tk.END)
+
+    def _abort_run(self) -> None:
+        """Bricht den aktuellen Lauf ab, ohne Eingaben und Rundenzeiten zu löschen."""
+
         if self.after_id is not None:
             try:
                 self.root.after_cancel(self.after_id)
             except tk.TclError:
                 pass
             self.after_id = None
+        self._cancel_flash_callback()
+        self._cancel_trace_generation()
 
         self._reset_timer()
         self.is_running = False
         self.is_paused = False
-        self.step_generator = None
+        self.step_trace = None
+        self.step_index = 0
         self.active_algorithm_key = None
         self.current_data = []
-        self.sorted_indices.clear()
+        self.sorted_mask = []
+        self.sorted_count = 0
         self.value_min = 0
         self.value_max = 0
         self.value_range = 1
@@ -485,13 +653,8 @@ class SortingVisualizer:
         self.canvas.delete("all")
         self.bar_rects.clear()
         self.bar_texts.clear()
-
-        self.run_history.clear()
-        self.total_runs = 0
-        self._update_results_table()
-
-        for entry in self.input_entries:
-            entry.delete(0, tk.END)
+        self.bar_colors.clear()
+        self._clear_geometry_cache()
 
         self.start_button.config(state=tk.NORMAL)
         self.pause_button.config(state=tk.DISABLED, text="Pause")
@@ -527,8 +690,8 @@ class SortingVisualizer:
     def _resume_timer(self) -> None:
         """Setzt die Stoppuhr nach einer Pause fort."""
 
-        if not self.is_running:
-            return
+        if not self.is_running or self.step_trace is None:
+            return  # Ohne fertige Schrittfolge läuft noch keine Zeitmessung
         if self.timer_base_time is None:
             self.timer_base_time = time.perf_counter()
         self._cancel_timer_callback()
@@ -666,6 +829,126 @@ class SortingVisualizer:
 
         return numbers
 
+    def _lookup_step_trace(
+        self, cache_key: Tuple[str, Tuple[int, ...]]
+    ) -> Optional[StepTrace]:
+        """Liefert eine bereits berechnete Schrittfolge aus dem Cache."""
+
+        trace = self.trace_cache.get(cache_key)
+        if trace is not None:
+            self.trace_cache.move_to_end(cache_key)
+        return trace
+
+    def _store_step_trace(
+        self, cache_key: Tuple[str, Tuple[int, ...]], trace: StepTrace
+    ) -> None:
+        """Legt eine neue Schrittfolge im Cache ab und verdrängt die älteste."""
+
+        self.trace_cache[cache_key] = trace
+        if len(self.trace_cache) > self.TRACE_CACHE_SIZE:
+            self.trace_cache.popitem(last=False)
+
+    def _await_step_trace(self, cache_key: Tuple[str, Tuple[int, ...]]) -> None:
+        """Wartet per after-Callback auf die Schrittfolge aus dem Hintergrund."""
+
+        self.trace_poll_after_id = None
+        future = self.trace_future
+        if future is None:
+            return
+        if not future.done():
+            self.trace_poll_after_id = self.root.after(
+                self.TRACE_POLL_INTERVAL_MS, self._await_step_trace, cache_key
+            )
+            return
+
+        self.trace_future = None
+        try:
+            trace = future.result()
+        except Exception as error:  # Fehler aus dem Hintergrund-Thread
+            self._abort_run()
+            messagebox.showerror(
+                "Berechnungsfehler",
+                f"Die Sortierschritte konnten nicht berechnet werden: {error}",
+            )
+            return
+        self._store_step_trace(cache_key, trace)
+        self.step_trace = trace
+        self.step_index = 0
+        self._start_playback()
+
+    def _start_playback(self) -> None:
+        """Startet Stoppuhr und Animation, sobald die Schrittfolge vorliegt."""
+
+        if self.is_paused:
+            return  # Beim Fortsetzen starten Stoppuhr und Animation gemeinsam
+        self._start_timer()
+        self.perform_next_step()
+
+    def _cancel_trace_generation(self) -> None:
+        """Verwirft eine noch laufende Schrittberechnung samt Abfrage."""
+
+        if self.trace_poll_after_id is not None:
+            try:
+                self.root.after_cancel(self.trace_poll_after_id)
+            except tk.TclError:
+                pass
+            self.trace_poll_after_id = None
+        if self.trace_future is not None:
+            self.trace_future.cancel()
+            self.trace_future = None
+
+    def _build_step_trace(
+        self,
+        generator_func: Callable[[Iterable[int]], StepGenerator],
+        numbers: List[int],
+        capacity: int,
+    ) -> StepTrace:
+        """Berechnet alle Schritte eines Laufs vorab und kodiert sie kompakt."""
+
+        trace = StepTrace(numbers, capacity)
+        for step in generator_func(numbers):
+            trace.append(step)
+        self._compact_steps(trace)
+        return trace
+
+    def _compact_steps(self, trace: StepTrace) -> None:
+        """Fasst unsichtbare Zwischenschritte zusammen, um Animationstakte zu sparen.
+
+        Ein Vergleich, auf den direkt das Zurücksetzen derselben Balken folgt,
+        wird zu einem einzigen ``flash_compare``-Schritt verschmolzen. Ein
+        ``revert``, dessen Balken im nächsten Schritt ohnehin neu eingefärbt
+        werden, entfällt ganz. Die Arrays werden dabei in-place verkürzt.
+        """
+
+        actions, first, second = trace.actions, trace.first, trace.second
+        count = len(trace)
+        read = 0
+        write = 0
+        while read < count:
+            action = actions[read]
+            next_action = -1  # Folgeschritt betrifft andere Balken
+            if read + 1 < count:
+                pair = {first[read], second[read]}
+                if {first[read + 1], second[read + 1]} == pair:
+                    next_action = actions[read + 1]
+
+            if action == REVERT and next_action in (COMPARE, SWAP):
+                read += 1
+                continue
+
+            if action == COMPARE and next_action == REVERT:
+                action = FLASH_COMPARE
+                skip = 2
+            else:
+                skip = 1
+            actions[write] = action
+            first[write] = first[read]
+            second[write] = second[read]
+            write += 1
+            read += skip
+
+        trace.truncate(write)
+
     def _bubble_sort_steps(self, numbers: Iterable[int]) -> StepGenerator:
         """Erzeugt Schritt-für-Schritt-Anweisungen für den Bubble Sort."""
 
@@ -736,14 +1019,6 @@ class SortingVisualizer:
         data = list(numbers)
         n = len(data)
 
-        def merge_sort(left: int, right: int) -> StepGenerator:
-            if left >= right:
-                return
-            mid = (left + right) // 2
-            yield from merge_sort(left, mid)
-            yield from merge_sort(mid + 1, right)
-            yield from merge(left, mid, right)
-
         def merge(left: int, mid: int, right: int) -> StepGenerator:
             left_part = data[left : mid + 1]
             right_part = data[mid + 1 : right + 1]
@@ -787,48 +1062,114 @@ class SortingVisualizer:
                 j += 1
                 k += 1
 
-        if n > 0:
-            yield from merge_sort(0, n - 1)
-            for index in range(n):
-                yield ("mark_sorted", index, None)
+        # Bottom-up: erst Teilfolgen der Länge 1 zusammenführen, dann 2, 4, ...
+        width = 1
+        while width < n:
+            for left in range(0, n, 2 * width):
+                mid = left + width - 1
+                right = min(left + 2 * width - 1, n - 1)
+                if mid < right:
+                    yield from merge(left, mid, right)
+            width *= 2
+
+        for index in range(n):
+            yield ("mark_sorted", index, None)
 
     def _quick_sort_steps(self, numbers: Iterable[int]) -> StepGenerator:
-        """Erzeugt Schrittanweisungen für Quick Sort (Lomuto-Partition)."""
+        """Erzeugt Schrittanweisungen für Quick Sort (Median-of-Three, iterativ)."""
 
         data = list(numbers)
         n = len(data)
 
-        def quick_sort(low: int, high: int) -> StepGenerator:
+        def order_pair(first: int, second: int) -> StepGenerator:
+            yield ("compare", first, second)
+            if data[second] < data[first]:
+                data[first], data[second] = data[second], data[first]
+                yield ("swap", first, second)
+            yield ("revert", first, second)
+
+        # Ein expliziter Stapel der offenen Teilbereiche ersetzt die Rekursion.
+        stack: List[Tuple[int, int]] = [(0, n - 1)] if n > 0 else []
+        while stack:
+            low, high = stack.pop()
             if low >= high:
                 if low == high:
                     yield ("mark_sorted", low, None)
-                return
+                continue
+
+            if high - low == 1:
+                yield from order_pair(low, high)
+                yield ("mark_sorted", low, None)
+                yield ("mark_sorted", high, None)
+                continue
+
+            # Median-of-Three: danach gilt data[low] <= data[mid] <= data[high].
+            mid = (low + high) // 2
+            yield from order_pair(low, mid)
+            yield from order_pair(low, high)
+            yield from order_pair(mid, high)
+
+            if high - low == 2:
+                for index in range(low, high + 1):
+                    yield ("mark_sorted", index, None)
+                continue
+
+            # Der Median wird direkt vor das bereits passende Ende gelegt und
+            # dient als Pivot für die Hoare-Partition des Innenbereichs. Beide
+            # Zeiger halten bei Werten gleich dem Pivot an, sodass auch viele
+            # gleiche Werte gleichmäßig aufgeteilt werden.
+            pivot_pos = high - 1
+            data[mid], data[pivot_pos] = data[pivot_pos], data[mid]
+            yield ("swap", mid, pivot_pos)
+            yield ("revert", mid, pivot_pos)
 
-            pivot_pos = high
             pivot_value = data[pivot_pos]
             i = low
-            for j in range(low, high):
-                yield ("compare", j, pivot_pos)
-                if data[j] <= pivot_value:
-                    if i != j:
-                        data[i], data[j] = data[j], data[i]
-                        yield ("swap", i, j)
-                        yield ("revert", i, j)
+            j = pivot_pos
+            while True:
+                # Der Pivot selbst begrenzt die Suche von links.
+                i += 1
+                while i < pivot_pos:
+                    yield ("compare", i, pivot_pos)
+                    is_smaller = data[i] < pivot_value
+                    yield ("revert", i, pivot_pos)
+                    if not is_smaller:
+                        break
                     i += 1
-                yield ("revert", j, pivot_pos)
 
-            data[i], data[pivot_pos] = data[pivot_pos], data[i]
-            yield ("swap", i, pivot_pos)
-            yield ("revert", i, pivot_pos)
+                # data[low] <= Pivot begrenzt die Suche von rechts.
+                j -= 1
+                while j > low:
+                    yield ("compare", j, pivot_pos)
+                    is_larger = data[j] > pivot_value
+                    yield ("revert", j, pivot_pos)
+                    if not is_larger:
+                        break
+                    j -= 1
+
+                if i >= j:
+                    break
+                data[i], data[j] = data[j], data[i]
+                yield ("swap", i, j)
+                yield ("revert", i, j)
+
+            if i != pivot_pos:
+                data[i], data[pivot_pos] = data[pivot_pos], data[i]
+                yield ("swap", i, pivot_pos)
+                yield ("revert", i, pivot_pos)
             yield ("mark_sorted", i, None)
 
-            yield from quick_sort(low, i - 1)
-            yield from quick_sort(i + 1, high)
+            # Den kleineren Teilbereich zuletzt ablegen, damit er zuerst
+            # bearbeitet wird und der Stapel flach bleibt.
+            left_range = (low, i - 1)
+            right_range = (i + 1, high)
+            if i - low < high - i:
+                stack.extend((right_range, left_range))
+            else:
+                stack.extend((left_range, right_range))
 
-        if n > 0:
-            yield from quick_sort(0, n - 1)
-            for index in range(n):
-                yield ("mark_sorted", index, None)
+        for index in range(n):
+            yield ("mark_sorted", index, None)
 
     def _heap_sort_steps(self, numbers: Iterable[int]) -> StepGenerator:
         """Erzeugt Schrittanweisungen für Heap Sort."""
@@ -837,28 +1178,33 @@ class SortingVisualizer:
         n = len(data)
 
         def heapify(size: int, root: int) -> StepGenerator:
-            largest = root
-            left = 2 * root + 1
-            right = 2 * root + 2
-
-            if left < size:
-                yield ("compare", root, left)
-                if data[left] > data[largest]:
-                    largest = left
-                yield ("revert", root, left)
-
-            if right < size:
-                compare_index = largest
-                yield ("compare", compare_index, right)
-                if data[right] > data[largest]:
-                    largest = right
-                yield ("revert", compare_index, right)
-
-            if largest != root:
+            # Iteratives Versickern: der Wert wandert so lange nach unten,
+            # bis kein Kind mehr größer ist.
+            while True:
+                largest = root
+                left = 2 * root + 1
+                right = 2 * root + 2
+
+                if left < size:
+                    yield ("compare", root, left)
+                    if data[left] > data[largest]:
+                        largest = left
+                    yield ("revert", root, left)
+
+                if right < size:
+                    compare_index = largest
+                    yield ("compare", compare_index, right)
+                    if data[right] > data[largest]:
+                        largest = right
+                    yield ("revert", compare_index, right)
+
+                if largest == root:
+                    break
+
                 data[root], data[largest] = data[largest], data[root]
                 yield ("swap", root, largest)
                 yield ("revert", root, largest)
-                yield from heapify(size, largest)
+                root = largest
 
         for index in range(n // 2 - 1, -1, -1):
             yield from heapify(n, index)
@@ -882,27 +1228,25 @@ class SortingVisualizer:
         if self.after_id is not None:
             self.after_id = None
 
-        if not self.is_running or self.is_paused or self.step_generator is None:
+        trace = self.step_trace
+        if not self.is_running or self.is_paused or trace is None:
             return
 
-        try:
-            action, first_index, second_value = next(self.step_generator)
-        except StopIteration:
+        # Ein noch ausstehendes Zurücksetzen nach ``flash_compare`` wird vor
+        # jedem Schritt erledigt, damit es keine neueren Farben überschreibt
+        # (etwa wenn Pause/Fortsetzen den nächsten Schritt vorzieht).
+        self._flush_flash_callback()
+
+        index = self.step_index
+        if index >= len(trace):
             self._finish_sorting()
             return
 
-        if action == "compare" and second_value is not None:
-            self._highlight_compare(first_index, second_value)
-        elif action == "swap" and second_value is not None:
-            self._highlight_swap(first_index, second_value)
-        elif action == "overwrite" and second_value is not None:
-            self._apply_overwrite(first_index, second_value)
-        elif action == "revert" and second_value is not None:
-            self._reset_colors(first_index, second_value)
-        elif action == "mark_sorted":
-            self._mark_sorted(first_index)
-
-        if not self.is_running or self.is_paused or self.step_generator is None:
+        self.step_index = index + 1
+        handler = self._step_handlers[trace.actions[index]]
+        handler(trace.first[index], trace.second[index])
+
+        if not self.is_running or self.is_paused or self.step_trace is None:
             return
 
         delay = max(10, int(self.animation_speed_ms))
@@ -913,7 +1257,7 @@ class SortingVisualizer:
 
         if self._is_finalizing_run:
             return
-        if not self.is_running and self.step_generator is None:
+        if not self.is_running and self.step_trace is None:
             return
 
         self._is_finalizing_run = True
@@ -925,6 +1269,7 @@ class SortingVisualizer:
                 except tk.TclError:
                     pass
                 self.after_id = None
+            self._cancel_flash_callback()
 
             elapsed_ms = self._stop_timer()
             self._record_run_result(elapsed_ms)
@@ -932,11 +1277,12 @@ class SortingVisualizer:
             self.is_running = False
             self.is_paused = False
             self.after_id = None
-            self.step_generator = None
+            self.step_trace = None
+            self.step_index = 0
             self.pause_button.config(state=tk.DISABLED, text="Pause")
             self.start_button.config(state=tk.NORMAL)
-            for index in range(len(self.current_data)):
-                if index not in self.sorted_indices:
+            for index, is_sorted in enumerate(self.sorted_mask):
+                if not is_sorted:
                     self._mark_sorted(index)
             self._set_algorithm_buttons_state(tk.NORMAL)
         finally:
@@ -948,15 +1294,51 @@ class SortingVisualizer:
         self._set_bar_color(i, self.COMPARE_COLOR)
         self._set_bar_color(j, self.COMPARE_COLOR)
 
+    def _flash_compare(self, i: int, j: int) -> None:
+        """Zeigt einen Vergleich kurz an und setzt die Farben selbstständig zurück."""
+
+        self._highlight_compare(i, j)
+        delay = max(10, int(self.animation_speed_ms)) // 3
+        self.flash_indices = (i, j)
+        self.flash_after_id = self.root.after(delay, self._flush_flash_callback)
+
+    def _flush_flash_callback(self) -> None:
+        """Setzt die Balken eines laufenden ``flash_compare`` sofort zurück."""
+
+        pending = self.flash_indices
+        self._cancel_flash_callback()
+        if pending is not None:
+            self._reset_colors(*pending)
+
+    def _cancel_flash_callback(self) -> None:
+        """Bricht das geplante Zurücksetzen nach einem Vergleich sicher ab."""
+
+        if self.flash_after_id is not None:
+            try:
+                self.root.after_cancel(self.flash_after_id)
+            except tk.TclError:
+                pass
+            self.flash_after_id = None
+        self.flash_indices = None
+
     def _highlight_swap(self, i: int, j: int) -> None:
         """Zeigt einen Swap (rot) an und aktualisiert die Balkenhöhen."""
 
-        self.current_data[i], self.current_data[j] = (
-            self.current_data[j],
-            self.current_data[i],
-        )
-        self._update_bar_height(i)
-        self._update_bar_height(j)
+        first_value = self.current_data[i]
+        second_value = self.current_data[j]
+        if first_value != second_value:
+            # Bei gleichen Werten ändert sich nichts an Höhe und Beschriftung.
+            self.current_data[i] = second_value
+            self.current_data[j] = first_value
+            self._update_bar_rect(i)
+            self._update_bar_rect(j)
+
+            # Die Beschriftungen wandern mit ihren Werten: Ihre Höhe hängt nur
+            # vom Wert ab, daher genügt eine waagerechte Verschiebung.
+            dx = self.bar_x_centers[j] - self.bar_x_centers[i]
+            self.canvas.move(self.bar_texts[i], dx, 0)
+            self.canvas.move(self.bar_texts[j], -dx, 0)
+            self.bar_texts[i], self.bar_texts[j] = self.bar_texts[j], self.bar_texts[i]
 
         self._set_bar_color(i, self.SWAP_COLOR)
         self._set_bar_color(j, self.SWAP_COLOR)
@@ -964,31 +1346,40 @@ class SortingVisualizer:
     def _apply_overwrite(self, index: int, value: int) -> None:
         """Schreibt einen neuen Wert an eine Position und hebt ihn hervor."""
 
-        self.current_data[index] = value
-        self._update_bar_height(index)
+        if self.current_data[index] != value:
+            self.current_data[index] = value
+            self._update_bar_height(index)
         self._set_bar_color(index, self.SWAP_COLOR)
 
+    def _apply_overwrite_slot(self, index: int, value_slot: int) -> None:
+        """Dekodiert den Wert eines ``overwrite``-Schritts und schreibt ihn."""
+
+        if self.step_trace is not None:
+            self._apply_overwrite(index, self.step_trace.values[value_slot])
+
     def _reset_colors(self, i: int, j: int) -> None:
         """Setzt die Balkenfarben nach einem Vergleich/Tausch zurück."""
 
-        if i not in self.sorted_indices:
+        if not self.sorted_mask[i]:
             self._set_bar_color(i, self.DEFAULT_COLOR)
-        if j not in self.sorted_indices:
+        if not self.sorted_mask[j]:
             self._set_bar_color(j, self.DEFAULT_COLOR)
 
     def _mark_sorted(self, index: int) -> None:
         """Hebt einen Balken als endgültig sortiert hervor."""
 
         if 0 <= index < len(self.current_data):
-            was_new = index not in self.sorted_indices
-            self.sorted_indices.add(index)
+            was_new = not self.sorted_mask[index]
+            if was_new:
+                self.sorted_mask[index] = True
+                self.sorted_count += 1
             self._set_bar_color(index, self.SORTED_COLOR)
 
             if (
                 was_new
                 and not self._is_finalizing_run
                 and self.is_running
-                and len(self.sorted_indices) == len(self.current_data)
+                and self.sorted_count == len(self.current_data)
             ):
                 self._finish_sorting()
 
@@ -1001,6 +1392,8 @@ class SortingVisualizer:
         self.canvas.delete("all")
         self.bar_rects.clear()
         self.bar_texts.clear()
+        self.bar_colors.clear()
+        self._clear_geometry_cache()
 
         if not values:
             return
@@ -1012,6 +1405,29 @@ class SortingVisualizer:
         self.slot_width = (self.canvas_width - 2 * self.BAR_PADDING) / len(values)
         self.bar_width = self.slot_width * 0.7
 
+        # Sortieren vertauscht nur Werte, daher reichen x-Positionen je Index
+        # und Höhen je Wert für alle späteren Aktualisierungen aus.
+        half_width = self.bar_width / 2
+        for index in range(len(values)):
+            x_center = self.BAR_PADDING + index * self.slot_width + self.slot_width / 2
+            self.bar_x_centers.append(x_center)
+            self.bar_x0.append(x_center - half_width)
+            self.bar_x1.append(x_center + half_width)
+
+        # Die Skalierung hängt nur vom Canvas und vom Wertebereich ab und wird
+        # deshalb einmal vor der Schleife bestimmt.
+        max_height = max(self.canvas_height - 120, 40)
+        base_height = 20
+        dynamic_height = max_height - base_height
+        for value in values:
+            if value not in self.bar_heights:
+                normalized = (value - self.value_min) / self.value_range
+                normalized = min(max(normalized, 0.0), 1.0)
+                bar_height = base_height + normalized * dynamic_height
+                self.bar_heights[value] = bar_height
+                self.label_ys[value] = max(self.base_line_y - bar_height - 12, 15)
+                self.label_texts[value] = str(value)
+
         self.canvas.create_line(
             self.BAR_PADDING / 2,
             self.base_line_y,
@@ -1021,32 +1437,35 @@ class SortingVisualizer:
         )
 
         for index, value in enumerate(values):
-            x_center = self.BAR_PADDING + index * self.slot_width + self.slot_width / 2
-            x0 = x_center - self.bar_width / 2
-            x1 = x_center + self.bar_width / 2
-            bar_height = self._calculate_bar_height(value)
-            y0 = self.base_line_y - bar_height
-            y1 = self.base_line_y
-
             rect = self.canvas.create_rectangle(
-                x0,
-                y0,
-                x1,
-                y1,
+                self.bar_x0[index],
+                self.base_line_y - self.bar_heights[value],
+                self.bar_x1[index],
+                self.base_line_y,
                 fill=self.DEFAULT_COLOR,
                 outline="",
             )
             self.bar_rects.append(rect)
+            self.bar_colors.append(self.DEFAULT_COLOR)
 
-            label_y = max(y0 - 12, 15)
             text = self.canvas.create_text(
-                x_center,
-                label_y,
-                text=str(value),
+                self.bar_x_centers[index],
+                self.label_ys[value],
+                text=self.label_texts[value],
                 font=("Helvetica", 12, "bold"),
             )
             self.bar_texts.append(text)
 
+    def _clear_geometry_cache(self) -> None:
+        """Verwirft die vorberechnete Balkengeometrie des letzten Laufs."""
+
+        self.bar_x_centers.clear()
+        self.bar_x0.clear()
+        self.bar_x1.clear()
+        self.bar_heights.clear()
+        self.label_ys.clear()
+        self.label_texts.clear()
+
     def _update_bar_height(self, index: int) -> None:
         """Passt die Höhe eines Balkens an die geänderten Daten an."""
 
@@ -1054,38 +1473,33 @@ class SortingVisualizer:
             return
 
         value = self.current_data[index]
+        self._update_bar_rect(index)
+        self.canvas.itemconfig(self.bar_texts[index], text=self.label_texts[value])
+        self.canvas.coords(
+            self.bar_texts[index], self.bar_x_centers[index], self.label_ys[value]
+        )
 
-        x_center = self.BAR_PADDING + index * self.slot_width + self.slot_width / 2
-        x0 = x_center - self.bar_width / 2
-        x1 = x_center + self.bar_width / 2
-
-        bar_height = self._calculate_bar_height(value)
-        y0 = self.base_line_y - bar_height
-        y1 = self.base_line_y
+    def _update_bar_rect(self, index: int) -> None:
+        """Setzt nur das Rechteck eines Balkens auf die Höhe seines Werts."""
 
-        self.canvas.coords(self.bar_rects[index], x0, y0, x1, y1)
-        self.canvas.itemconfig(self.bar_texts[index], text=str(value))
-        label_y = max(y0 - 12, 15)
-        self.canvas.coords(self.bar_texts[index], x_center, label_y)
+        value = self.current_data[index]
+        self.canvas.coords(
+            self.bar_rects[index],
+            self.bar_x0[index],
+            self.base_line_y - self.bar_heights[value],
+            self.bar_x1[index],
+            self.base_line_y,
+        )
 
     def _set_bar_color(self, index: int, color: str) -> None:
         """Aktualisiert die Farbe eines Balkens."""
 
-        if 0 <= index < len(self.bar_rects):
+        # Nur echte Farbwechsel an den Canvas weiterreichen; jedes itemconfig
+        # ist ein eigener Aufruf in den Tcl-Interpreter.
+        if 0 <= index < len(self.bar_rects) and self.bar_colors[index] != color:
+            self.bar_colors[index] = color
             self.canvas.itemconfig(self.bar_rects[index], fill=color)
 
-    def _calculate_bar_height(self, value: int) -> float:
-        """Berechnet die visuelle Höhe eines Balkens für einen gegebenen Wert."""
-
-        max_height = self.canvas_height - 120
-        max_height = max(max_height, 40)
-        base_height = 20
-        dynamic_height = max_height - base_height
-        value_range = max(self.value_range, 1)
-        normalized = (value - self.value_min) / value_range
-        normalized = min(max(normalized, 0.0), 1.0)
-        return base_height + normalized * dynamic_height
-
     # ------------------------------------------------------------------
     # Startpunkt der Anwendung
     # ------------------------------------------------------------------
@@ -1093,6 +1507,7 @@ class SortingVisualizer:
         """Startet die tkinter-Ereignisschleife."""
 
         self.root.mainloop()
+        self.trace_executor.shutdown(wait=False)
 
 
 if __name__ == "__main__":